@@ -136,7 +136,10 @@ class ProgressBar(pl.callbacks.ProgressBar):
         format_dict = pbar.format_dict
         if timer is not None:
             log.debug(
-                f"{prefix} - lightning-elapsed={format_dict['elapsed']} elapsed={timer.value}"
+                "{} - lightning-elapsed={} elapsed={}",
+                prefix,
+                format_dict["elapsed"],
+                timer.value,
             )
             format_dict["elapsed"] = timer.value
         # remove the square blocks, they provide no info
@@ -33,7 +33,8 @@ class TrainingTimer(pl.Callback):
     def on_train_epoch_end(self, trainer, *args, **kwargs):
         super().on_train_epoch_end(trainer, *args, **kwargs)
         _logger.info(
-            f"E{trainer.current_epoch}: "
-            f"tr_time={self.time_to_str(self.tr_timer.value)}, "
-            f"va_time={self.time_to_str(self.va_timer.value)}"
+            "E{}: tr_time={}, va_time={}",
+            trainer.current_epoch,
+            self.time_to_str(self.tr_timer.value),
+            self.time_to_str(self.va_timer.value),
         )
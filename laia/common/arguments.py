@@ -171,6 +171,15 @@ class DataArgs:
     Args:
         batch_size: Batch size
         color_mode: L (grayscale): 1 channel, RGB: 3 channels, RGBA: 4 channels
+        pad_width_multiple: Pad the width of each batch to a multiple of this
+            value. Reduces the number of distinct input shapes, which lets
+            cuDNN's autotuner (`--trainer.benchmark`) reuse its choices. However,
+            batches are then padded even if all their images have the same width
+            (unless it is already a multiple), so the RNN runs on packed
+            sequences and cuDNN's CTC loss (`--train.cudnn_ctc_loss`) is not used
+        sharing_strategy: Strategy used to share the tensors loaded by the data
+            workers. Use file_system to avoid "too many open files" errors with
+            many workers. If not set, PyTorch's default is used
     """
 
     class ColorMode(str, Enum):
@@ -178,8 +187,14 @@ class DataArgs:
         RGB = "RGB"
         RGBA = "RGBA"
 
+    class SharingStrategy(str, Enum):
+        file_descriptor = "file_descriptor"
+        file_system = "file_system"
+
     batch_size: PositiveInt = 8
     color_mode: ColorMode = ColorMode.L
+    pad_width_multiple: Optional[PositiveInt] = None
+    sharing_strategy: Optional[SharingStrategy] = None
 
 
 @dataclass
@@ -199,6 +214,23 @@ class TrainArgs:
         gpu_stats: Whether to include GPU stats in the training progress bar
         augment_training: Whether to use dynamic distortions to augment
             the training data
+        bucket_by_width: Whether to build the training batches with images
+            of similar width, which reduces the amount of padding
+        img_cache_size: Maximum size (in MB) of the training images decoded
+            once before training, and shared by the data loader workers.
+            If 0, images are not cached
+        preload_validation: Whether to load the validation set into memory
+            once, and iterate it without data loader workers. Recommended for
+            small validation sets. With DDP, each process only loads its share
+        cudnn_ctc_loss: Whether to allow cuDNN's CTC loss implementation, used
+            when all its requirements are met (e.g. no padded images in the batch)
+        channels_last: Whether to use the channels last memory format for the
+            convolutional layers, which is faster with tensor cores (e.g. with AMP).
+            Has little effect if the model uses masks (`use_masks`), because
+            masking converts each convolution output back to channels first
+        allow_tf32: Whether to allow TensorFloat-32 in matmuls (e.g. the linear
+            layers) on Ampere (or newer) GPUs. PyTorch already allows it by default
+            in cuDNN's convolutions and RNNs, regardless of this flag
     """
 
     delimiters: Optional[List[str]] = field(default_factory=lambda: ["<space>"])
@@ -207,6 +239,12 @@ class TrainArgs:
     early_stopping_patience: NonNegativeInt = 20
     gpu_stats: bool = False
     augment_training: bool = False
+    bucket_by_width: bool = False
+    img_cache_size: NonNegativeInt = 0
+    preload_validation: bool = False
+    cudnn_ctc_loss: bool = False
+    channels_last: bool = False
+    allow_tf32: bool = False
 
 
 @dataclass
@@ -280,10 +318,7 @@ class TrainerArgs(make_dataclass("", __get_trainer_fields())):
             version.parse(torch.__version__) < version.parse("1.7.0")
             and self.precision != 32
         ):
-            raise ValueError(
-                "AMP requires torch>=1.7.0. Additionally, only "
-                "fixed height models are currently supported"
-            )
+            raise ValueError("AMP requires torch>=1.7.0")
 
 
 @dataclass
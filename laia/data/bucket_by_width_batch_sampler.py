@@ -0,0 +1,68 @@
+import math
+from typing import Dict, Iterator, List, Sequence
+
+import torch
+from torch.utils.data import Sampler
+
+
+class BucketByWidthBatchSampler(Sampler):
+    """
+    Batch sampler which groups together samples of similar width.
+
+    Samples are assigned to exponentially spaced buckets according to their
+    width (a bucket spans widths in [r^k, r^(k+1)), where r is `bucket_ratio`),
+    and each batch is drawn from a single bucket. This reduces the amount of
+    padding in each batch, and thus the wasted computation.
+
+    Example::
+        >>> widths = [imagesize.get(f)[0] for f in filepaths]
+        >>> sampler = BucketByWidthBatchSampler(widths, batch_size=16)
+        >>> loader = DataLoader(dataset, batch_sampler=sampler)
+
+    Args:
+        widths: Width of each sample in the dataset
+        batch_size: Maximum number of samples in each batch
+        bucket_ratio: Ratio between the widths of consecutive buckets
+        shuffle: Whether to shuffle the samples in each bucket and the
+            order of the batches on every epoch
+        drop_last: Whether to drop the last incomplete batch of each bucket
+    """
+
+    def __init__(
+        self,
+        widths: Sequence[int],
+        batch_size: int,
+        bucket_ratio: float = 1.25,
+        shuffle: bool = True,
+        drop_last: bool = False,
+    ) -> None:
+        assert batch_size > 0
+        assert bucket_ratio > 1
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        buckets: Dict[int, List[int]] = {}
+        log_ratio = math.log(bucket_ratio)
+        for i, w in enumerate(widths):
+            key = int(math.log(max(w, 1)) / log_ratio)
+            buckets.setdefault(key, []).append(i)
+        self.buckets = [buckets[k] for k in sorted(buckets)]
+
+    def __iter__(self) -> Iterator[List[int]]:
+        batches = []
+        for bucket in self.buckets:
+            if self.shuffle:
+                bucket = [bucket[i] for i in torch.randperm(len(bucket)).tolist()]
+            for i in range(0, len(bucket), self.batch_size):
+                batch = bucket[i : i + self.batch_size]
+                if self.drop_last and len(batch) < self.batch_size:
+                    continue
+                batches.append(batch)
+        if self.shuffle:
+            batches = [batches[i] for i in torch.randperm(len(batches)).tolist()]
+        return iter(batches)
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return sum(len(b) // self.batch_size for b in self.buckets)
+        return sum(math.ceil(len(b) / self.batch_size) for b in self.buckets)
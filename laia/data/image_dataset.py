@@ -6,20 +6,49 @@ from PIL import Image
 
 class ImageDataset(torch.utils.data.Dataset):
     def __init__(
-        self, imgs: List[str], transform: Optional[Callable[[Image.Image], Any]] = None
+        self,
+        imgs: List[str],
+        transform: Optional[Callable[[Image.Image], Any]] = None,
+        cache_size: int = 0,
     ):
         assert isinstance(imgs, (list, tuple))
+        assert cache_size >= 0
         super().__init__()
         self._imgs = imgs
         self._transform = transform
+        self._cache = self.decode_images(cache_size) if cache_size else {}
+
+    @property
+    def imgs(self) -> List[str]:
+        return self._imgs
+
+    def decode_images(self, max_bytes: int) -> Dict[int, Image.Image]:
+        """Decodes the images, in order, until they would take more than
+        `max_bytes`. Forked data loader workers share them copy-on-write."""
+        cache, used = {}, 0
+        for i, filepath in enumerate(self._imgs):
+            img = Image.open(filepath)
+            img.load()
+            used += img.width * img.height * len(img.getbands())
+            if used > max_bytes:
+                break
+            cache[i] = img
+        return cache
 
     def __getitem__(self, index: int) -> Dict[str, Any]:
         """Returns a dictionary containing the given image from the dataset.
         The image is associated with the key 'img'."""
-        img = Image.open(self._imgs[index])
+        img = self.load_image(index)
         if self._transform:
             img = self._transform(img)
         return {"img": img}
 
+    def load_image(self, index: int) -> Image.Image:
+        img = self._cache.get(index)
+        if img is None:
+            return Image.open(self._imgs[index])
+        # the transforms must not modify the cached image
+        return img.copy()
+
     def __len__(self) -> int:
         return len(self._imgs)
@@ -53,18 +53,35 @@ def by_descending_width(x):
 
 
 class PaddingCollater:
-    def __init__(self, sizes: Any, sort_key: Callable = None):
+    """Collate a batch, padding the tensors with variable sizes.
+
+    Args:
+        sizes: Expected size of each tensor dimension. Use None for
+            the dimensions with variable size.
+        sort_key: If given, sort the batch elements using this key.
+        size_multiples: Optional, same structure as `sizes`. The padded
+            size of a variable dimension is rounded up to a multiple of the
+            given value, which keeps the number of distinct batch shapes small
+            (e.g. to benefit from cuDNN's autotuner).
+    """
+
+    def __init__(
+        self, sizes: Any, sort_key: Callable = None, size_multiples: Any = None
+    ):
         self._sizes = sizes
         self._sort_key = sort_key
+        self._size_multiples = size_multiples
 
     def __call__(self, batch: Any) -> torch.Tensor:
         if self._sort_key:
             batch = sorted(batch, key=self._sort_key)
-        return self.collate(batch, self._sizes)
+        return self.collate(batch, self._sizes, self._size_multiples)
 
     @staticmethod
     def get_max_sizes(
-        batch: List[torch.Tensor], sizes: Optional[Tuple[Union[int, None], ...]] = None
+        batch: List[torch.Tensor],
+        sizes: Optional[Tuple[Union[int, None], ...]] = None,
+        size_multiples: Optional[Tuple[Union[int, None], ...]] = None,
     ) -> Tuple[int, ...]:
         # All tensors in the batch must have the same number of dimensions
         dim = batch[0].dim()
@@ -75,6 +92,8 @@ class PaddingCollater:
             min_v = min(x.size(d) for x in batch)
             if sizes and sizes[d] is not None:
                 assert max_v == min_v == sizes[d]
+            elif size_multiples and size_multiples[d]:
+                max_v = -(-max_v // size_multiples[d]) * size_multiples[d]
             max_sizes.append(max_v)
         return tuple(max_sizes)
 
@@ -90,26 +109,36 @@ class PaddingCollater:
             batch_tensor.add_(x)
         return out
 
-    def collate(self, batch: Any, sizes: Any) -> Any:
+    def collate(self, batch: Any, sizes: Any, size_multiples: Any = None) -> Any:
         elem, elem_type = batch[0], type(batch[0])
         if isinstance(elem, torch.Tensor):
             if any(s is None for s in sizes):
-                max_sizes = PaddingCollater.get_max_sizes(batch, sizes)
+                max_sizes = PaddingCollater.get_max_sizes(batch, sizes, size_multiples)
                 x = PaddingCollater.collate_tensors(batch, max_sizes)
                 xs = torch.stack([torch.tensor(x.size()) for x in batch])
                 return PaddedTensor.build(x, xs)
             return torch.stack(batch)
         if isinstance(elem, np.ndarray):
-            return self.collate([torch.from_numpy(b) for b in batch], sizes)
+            return self.collate(
+                [torch.from_numpy(b) for b in batch], sizes, size_multiples
+            )
         if isinstance(elem, Mapping):
             return {
-                k: self.collate([d[k] for d in batch], sizes[k])
+                k: self.collate(
+                    [d[k] for d in batch],
+                    sizes[k],
+                    size_multiples.get(k) if size_multiples else None,
+                )
                 if k in sizes
                 else [d[k] for d in batch]
                 for k in elem
             }
         if isinstance(elem, Sequence):
-            return [self.collate(b, s) for b, s in zip(batch, sizes)]
+            if size_multiples is None:
+                size_multiples = [None] * len(sizes)
+            return [
+                self.collate(b, s, m) for b, s, m in zip(batch, sizes, size_multiples)
+            ]
         raise TypeError(
             f"Batch must contain tensors, numbers, dicts or lists. Found {elem_type}"
         )
@@ -10,20 +10,17 @@ class TextImageDataset(ImageDataset):
         txts: List[str],
         img_transform: Callable = None,
         txt_transform: Callable = None,
+        img_cache_size: int = 0,
     ):
-        super().__init__(imgs, img_transform)
+        super().__init__(imgs, img_transform, cache_size=img_cache_size)
         assert len(imgs) == len(txts)
-        self._txts = txts
-        self._txt_transform = txt_transform
+        # Transcripts are static, so transform them only once
+        self._txts = [txt_transform(txt) for txt in txts] if txt_transform else txts
 
     def __getitem__(self, index: int) -> Dict[str, Any]:
         """Returns an image and its transcript from the dataset."""
         # Get image
         out = super().__getitem__(index)
         # Get transcript
-        txt = self._txts[index]
-        if self._txt_transform:
-            txt = self._txt_transform(txt)
-        # Return image and transcript
-        out["txt"] = txt
+        out["txt"] = self._txts[index]
         return out
@@ -18,6 +18,7 @@ class TextImageFromTextTableDataset(TextImageDataset):
         img_transform: Callable = None,
         txt_transform: Callable = None,
         img_extensions: List[str] = IMAGE_EXTENSIONS,
+        img_cache_size: int = 0,
     ):
         if img_dirs is None:
             img_dirs = []
@@ -29,7 +30,9 @@ class TextImageFromTextTableDataset(TextImageDataset):
             txt_table, img_dirs=img_dirs, img_extensions=img_extensions
         )
         # Prepare dataset using the previous image filenames and transcripts.
-        super().__init__(imgs, txts, img_transform, txt_transform)
+        super().__init__(
+            imgs, txts, img_transform, txt_transform, img_cache_size=img_cache_size
+        )
 
     def __getitem__(self, index: int) -> Dict[str, Any]:
         """Returns the ID of the example, the image and its transcript from
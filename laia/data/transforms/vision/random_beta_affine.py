@@ -2,7 +2,6 @@ from typing import Tuple, Union
 
 import numpy as np
 from PIL import Image
-from scipy.linalg import solve
 
 
 class RandomBetaAffine:
@@ -52,11 +51,11 @@ class RandomBetaAffine:
     def get_affine_transform(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
         assert src.shape == (3, 2)
         assert dst.shape == (3, 2)
-        coeffs = np.zeros((6, 6), dtype=np.float32)
-        for i in [0, 1, 2]:
-            coeffs[i, 0:2] = coeffs[i + 3, 3:5] = src[i]
-            coeffs[i, 2] = coeffs[i + 3, 5] = 1
-        return solve(coeffs, dst.transpose().flatten())
+        # The x and y coefficients are independent: solve both 3x3 systems
+        # at once, instead of the equivalent block-diagonal 6x6 system
+        coeffs = np.ones((3, 3), dtype=np.float32)
+        coeffs[:, 0:2] = src
+        return np.linalg.solve(coeffs, dst).transpose().flatten()
 
 
 if __name__ == "__main__":
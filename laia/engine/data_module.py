@@ -1,7 +1,8 @@
 import multiprocessing
 import random
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
+import imagesize
 import numpy as np
 import pytorch_lightning as pl
 import torch
@@ -14,6 +15,7 @@ from laia.data import (
     PaddingCollater,
     TextImageFromTextTableDataset,
 )
+from laia.data.bucket_by_width_batch_sampler import BucketByWidthBatchSampler
 from laia.data.padding_collater import by_descending_width
 from laia.data.unpadded_distributed_sampler import UnpaddedDistributedSampler
 from laia.utils import SymbolsTable
@@ -34,8 +36,13 @@ class DataModule(pl.LightningDataModule):
         color_mode: str = "L",
         shuffle_tr: bool = True,
         augment_tr: bool = False,
+        bucket_tr: bool = False,
+        img_cache_size: int = 0,
+        preload_va: bool = False,
         stage: str = "fit",
         num_workers: Optional[int] = None,
+        pad_width_multiple: Optional[int] = None,
+        sharing_strategy: Optional[str] = None,
     ) -> None:
         assert stage in ("fit", "test")
         base_img_transform = transforms.vision.ToImageTensor(
@@ -44,14 +51,22 @@ class DataModule(pl.LightningDataModule):
         self.img_dirs = img_dirs
         self.img_channels = len(color_mode)
         self.batch_size = batch_size
+        self.pad_width_multiple = pad_width_multiple
+        self.sharing_strategy = sharing_strategy
         # TODO: https://github.com/PyTorchLightning/pytorch-lightning/issues/2196
-        self.num_workers = num_workers or multiprocessing.cpu_count()
+        # the workers are kept alive during the whole run, so cap their number
+        self.num_workers = (
+            min(multiprocessing.cpu_count(), 8) if num_workers is None else num_workers
+        )
         if stage == "fit":
             self.tr_ds = None
             self.va_ds = None
             self.tr_txt_table = tr_txt_table
             self.va_txt_table = va_txt_table
             self.shuffle_tr = shuffle_tr
+            self.bucket_tr = bucket_tr
+            self.img_cache_size = img_cache_size
+            self.preload_va = preload_va
             tr_img_transform = transforms.vision.ToImageTensor(
                 mode=color_mode,
                 invert=True,
@@ -61,7 +76,7 @@ class DataModule(pl.LightningDataModule):
                 else None,
             )
             txt_transform = transforms.text.ToTensor(syms)
-            _logger.info(f"Training data transforms:\n{tr_img_transform}")
+            _logger.info("Training data transforms:\n{}", tr_img_transform)
             super().__init__(
                 train_transforms=(tr_img_transform, txt_transform),
                 val_transforms=base_img_transform,
@@ -72,6 +87,9 @@ class DataModule(pl.LightningDataModule):
             super().__init__(test_transforms=base_img_transform)
 
     def setup(self, stage: Optional[str] = None):
+        if self.sharing_strategy is not None:
+            # done here so that it also applies to spawned (DDP) processes
+            torch.multiprocessing.set_sharing_strategy(self.sharing_strategy)
         if stage == "fit":
             tr_img_transform, txt_transform = self.train_transforms
             self.tr_ds = TextImageFromTextTableDataset(
@@ -79,6 +97,8 @@ class DataModule(pl.LightningDataModule):
                 self.img_dirs,
                 img_transform=tr_img_transform,
                 txt_transform=txt_transform,
+                # decoded here, before the workers are forked, so they share them
+                img_cache_size=self.img_cache_size,
             )
             self.va_ds = TextImageFromTextTableDataset(
                 self.va_txt_table,
@@ -86,6 +106,13 @@ class DataModule(pl.LightningDataModule):
                 img_transform=self.val_transforms,
                 txt_transform=txt_transform,
             )
+            if self.preload_va:
+                # the validation transforms are deterministic, so the samples
+                # can be loaded only once and kept in memory
+                sampler = self.get_unpadded_distributed_sampler(self.va_ds)
+                self.va_ds = DataModule.preload_samples(
+                    self.va_ds, range(len(self.va_ds)) if sampler is None else sampler
+                )
         elif stage == "test":
             self.te_ds = ImageFromListDataset(
                 self.te_img_list,
@@ -107,32 +134,60 @@ class DataModule(pl.LightningDataModule):
             shuffle=False,
         )
 
+    def get_bucket_by_width_batch_sampler(
+        self, ds: torch.utils.data.Dataset
+    ) -> Optional[BucketByWidthBatchSampler]:
+        # Lightning replaces the sampler with a DistributedSampler in these
+        # modes, which would silently drop the batch sampler
+        if (
+            self.trainer.use_ddp
+            or self.trainer.use_ddp2
+            or self.trainer.use_horovod
+            or self.trainer.use_tpu
+        ):
+            _logger.warning(
+                "Bucketing by width is not supported with distributed training, "
+                "using random batches"
+            )
+            return
+        widths = [imagesize.get(img)[0] for img in ds.imgs]
+        return BucketByWidthBatchSampler(
+            widths, batch_size=self.batch_size, shuffle=self.shuffle_tr
+        )
+
     def train_dataloader(self) -> DataLoader:
         assert self.tr_ds is not None
+        batch_sampler = (
+            self.get_bucket_by_width_batch_sampler(self.tr_ds)
+            if self.bucket_tr
+            else None
+        )
         return DataLoader(
             dataset=self.tr_ds,
-            batch_size=self.batch_size,
+            batch_size=self.batch_size if batch_sampler is None else 1,
             num_workers=self.num_workers,
-            shuffle=self.shuffle_tr,
+            shuffle=self.shuffle_tr if batch_sampler is None else False,
+            batch_sampler=batch_sampler,
             worker_init_fn=DataModule.worker_init_fn,
             pin_memory=self.trainer.on_gpu,
-            collate_fn=PaddingCollater(
-                {"img": (self.img_channels, None, None)}, sort_key=by_descending_width
-            ),
+            # keep the workers alive between epochs instead of re-spawning them
+            persistent_workers=self.num_workers > 0,
+            collate_fn=self.get_padding_collater(),
         )
 
     def val_dataloader(self) -> DataLoader:
         assert self.va_ds is not None
+        # the validation set is usually small, so a couple of workers suffice
+        num_workers = 0 if self.preload_va else min(self.num_workers, 2)
         return DataLoader(
             dataset=self.va_ds,
             batch_size=self.batch_size,
             shuffle=False,
             sampler=self.get_unpadded_distributed_sampler(self.va_ds),
-            num_workers=self.num_workers,
+            num_workers=num_workers,
             pin_memory=self.trainer.on_gpu,
-            collate_fn=PaddingCollater(
-                {"img": (self.img_channels, None, None)}, sort_key=by_descending_width
-            ),
+            persistent_workers=num_workers > 0,
+            collate_fn=self.get_padding_collater(),
         )
 
     def test_dataloader(self) -> DataLoader:
@@ -143,15 +198,30 @@ class DataModule(pl.LightningDataModule):
             sampler=self.get_unpadded_distributed_sampler(self.te_ds),
             num_workers=self.num_workers,
             pin_memory=self.trainer.on_gpu,
-            collate_fn=PaddingCollater(
-                {"img": (self.img_channels, None, None)}, sort_key=by_descending_width
-            ),
+            collate_fn=self.get_padding_collater(),
+        )
+
+    @staticmethod
+    def preload_samples(ds: torch.utils.data.Dataset, indices: Iterable[int]) -> List:
+        # the samples which are not loaded (e.g. read by other processes
+        # with DDP) are left as None, so that the indices still match
+        samples = [None] * len(ds)
+        for i in indices:
+            samples[i] = ds[i]
+        return samples
+
+    def get_padding_collater(self) -> PaddingCollater:
+        return PaddingCollater(
+            {"img": (self.img_channels, None, None)},
+            sort_key=by_descending_width,
+            size_multiples={"img": (None, None, self.pad_width_multiple)},
         )
 
     @staticmethod
     def worker_init_fn(worker_id):
-        # We need to reset the Numpy and Python PRNG, or we will get the
-        # same numbers in each epoch (when the workers are re-generated)
+        # We need to seed the Numpy and Python PRNG, or every worker would
+        # get the same numbers. The workers are persistent, so this runs once
+        # per worker and its PRNG state then carries over across epochs
         seed = (torch.initial_seed() + worker_id) % 2**32  # [0, 2**32)
         random.seed(seed)
         np.random.seed(seed)
@@ -47,6 +47,7 @@ class EngineModule(pl.LightningModule):
                 momentum=self.optimizer.momentum,
                 weight_decay=weight_decay,
                 nesterov=self.optimizer.nesterov,
+                foreach=True,
             )
         elif self.optimizer.name == "RMSProp":
             optimizer = torch.optim.RMSprop(
@@ -54,12 +55,14 @@ class EngineModule(pl.LightningModule):
                 lr=self.lr,
                 weight_decay=weight_decay,
                 momentum=self.optimizer.momentum,
+                foreach=True,
             )
         elif self.optimizer.name == "Adam":
             optimizer = torch.optim.Adam(
                 self.parameters(),
                 lr=self.lr,
                 weight_decay=weight_decay,
+                foreach=True,
             )
         else:
             raise NotImplementedError(f"Optimizer: {self.optimizer.name}")
@@ -79,6 +82,11 @@ class EngineModule(pl.LightningModule):
             return [optimizer], [scheduler]
         return optimizer
 
+    def optimizer_zero_grad(self, epoch, batch_idx, optimizer, optimizer_idx):
+        # note: the gradients are set to None instead of zero. Parameters which
+        # do not take part in a step will have a None gradient afterwards
+        optimizer.zero_grad(set_to_none=True)
+
     def prepare_batch(self, batch: Any) -> Tuple[Any, Any]:
         if self.batch_input_fn and self.batch_target_fn:
             return self.batch_input_fn(batch), self.batch_target_fn(batch)
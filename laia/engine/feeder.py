@@ -1,3 +1,4 @@
+import torch
 import torchvision
 
 from laia.data import PaddedTensor
@@ -39,14 +40,21 @@ class ImageFeeder(Feeder):
           returned without any size information. (default: True)
       keep_channels_in_size: Whether or not the number of channels of the
           images is kept as part of the size in the `PaddedTensor` objects.
+      channels_last: Whether or not to return the images in the channels last
+          (N x H x W x C) memory format, which is faster for convolutions with
+          tensor cores.
     """
 
     def __init__(
-        self, keep_padded_tensors: bool = True, keep_channels_in_size: bool = False
+        self,
+        keep_padded_tensors: bool = True,
+        keep_channels_in_size: bool = False,
+        channels_last: bool = False,
     ) -> None:
         super().__init__()
         self._keep_padded_tensors = keep_padded_tensors
         self._keep_channels_in_size = keep_channels_in_size
+        self._channels_last = channels_last
 
     @classmethod
     def view_as_4d(cls, x):
@@ -68,6 +76,8 @@ class ImageFeeder(Feeder):
         else:
             x, xs = x, None
         x = self.view_as_4d(x)  # N x C x H x W
+        if self._channels_last:
+            x = x.contiguous(memory_format=torch.channels_last)
         if xs is not None and self._keep_padded_tensors:
             if xs.size(1) == 3 and not self._keep_channels_in_size:
                 xs = xs[:, 1:]
@@ -1,4 +1,5 @@
 import itertools
+from contextlib import nullcontext
 from typing import Dict, List, Optional, Tuple
 
 import torch
@@ -54,10 +55,19 @@ class CTCLoss(Loss):
       average_frames (bool): Specifies whether the loss of each
         sample should be divided by its number of frames. Default: ``False''.
       blank (int): Index of the blank label. Default: 0.
+      use_cudnn (bool): Whether to allow cuDNN's CTC implementation. PyTorch
+        only uses it when all its requirements are met (blank=0, all input
+        lengths equal to the number of frames, target lengths < 256, ...) and
+        falls back to the native implementation otherwise, so the implementation
+        used may change from batch to batch. Default: ``False''.
     """
 
     def __init__(
-        self, reduction: str = "mean", average_frames: bool = False, blank: int = 0
+        self,
+        reduction: str = "mean",
+        average_frames: bool = False,
+        blank: int = 0,
+        use_cudnn: bool = False,
     ):
         super().__init__()
         assert reduction in (
@@ -69,6 +79,7 @@ class CTCLoss(Loss):
         self.average_frames = average_frames
         assert blank >= 0, "Blank index must be >= 0"
         self.blank = blank
+        self.use_cudnn = use_cudnn
 
     def forward(
         self, x: torch.Tensor, y: List[List[int]], **kwargs: Dict
@@ -90,7 +101,10 @@ class CTCLoss(Loss):
             _logger.warning("All samples in the batch were ignored!")
             return
 
-        # prepare tensors of the correct type
+        # prepare tensors of the correct type. The loss is computed in
+        # (at least) single precision, even if the model output is half precision
+        if x.dtype in (torch.half, torch.bfloat16):
+            x = x.float()
         x = torch.nn.functional.log_softmax(x, dim=-1)
         cpu = torch.device("cpu")
         xs = (
@@ -101,7 +115,12 @@ class CTCLoss(Loss):
         ys = torch.tensor([len(y_n) for y_n in y], dtype=torch.int, device=cpu)
         y = torch.tensor(list(itertools.chain.from_iterable(y)), dtype=torch.int)
 
-        with torch.backends.cudnn.flags(enabled=False):
+        cudnn_context = (
+            nullcontext()
+            if self.use_cudnn
+            else torch.backends.cudnn.flags(enabled=False)
+        )
+        with cudnn_context:
             losses = torch.nn.functional.ctc_loss(
                 log_probs=x,
                 targets=y,
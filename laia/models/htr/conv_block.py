@@ -80,7 +80,7 @@ class ConvBlock(nn.Module):
 
         x = self.conv(x)
         if self.use_masks:
-            x = mask_image_from_size(x, batch_sizes=xs, mask_value=0)
+            x = self.mask(x, xs)
 
         if self.batchnorm:
             x = self.batchnorm(x)
@@ -89,7 +89,7 @@ class ConvBlock(nn.Module):
             x = self.activation(x)
 
         if self.use_masks:
-            x = mask_image_from_size(x, batch_sizes=xs, mask_value=0)
+            x = self.mask(x, xs)
 
         if self.pool:
             x = self.pool(x)
@@ -98,6 +98,16 @@ class ConvBlock(nn.Module):
             x if xs is None else PaddedTensor.build(x, self.get_batch_output_size(xs))
         )
 
+    @staticmethod
+    def mask(x: Tensor, xs: Optional[Tensor]) -> Tensor:
+        # nnutils requires the default (N x C x H x W) memory format
+        if x.dtype == torch.half:
+            # nnutils does not support half precision (e.g. with AMP)
+            return mask_image_from_size(
+                x.float().contiguous(), batch_sizes=xs, mask_value=0
+            ).half()
+        return mask_image_from_size(x.contiguous(), batch_sizes=xs, mask_value=0)
+
     def get_batch_output_size(self, xs: torch.Tensor) -> torch.Tensor:
         ys = torch.zeros_like(xs)
         for dim in 0, 1:
@@ -80,7 +80,9 @@ class LaiaCRNN(nn.Module):
             ni * self.sequencer.fix_size,
             rnn_units,
             rnn_layers,
-            dropout=rnn_dropout,
+            # The RNN only applies dropout between layers. The input dropout
+            # is done in forward, so this is a no-op (and a warning) otherwise
+            dropout=rnn_dropout if rnn_layers > 1 else 0.0,
             bidirectional=True,
             batch_first=False,
         )
@@ -1,14 +1,16 @@
 import torch
+import torch.nn.functional as F
 from nnutils_pytorch import adaptive_avgpool_2d, adaptive_maxpool_2d
 
 from laia.data import PaddedTensor
 
 
 class AdaptivePool2d(torch.nn.Module):
-    def __init__(self, output_sizes, func):
+    def __init__(self, output_sizes, func, torch_func):
         super().__init__()
         self._output_sizes = output_sizes
         self._func = func
+        self._torch_func = torch_func
         self._fixed_size = isinstance(output_sizes, int) or (
             output_sizes[0] is not None and output_sizes[1] is not None
         )
@@ -17,9 +19,40 @@ class AdaptivePool2d(torch.nn.Module):
     def output_sizes(self):
         return self._output_sizes
 
+    def is_unpadded(self, x, xs):
+        """Whether the dimensions being pooled are not padded."""
+        output_sizes = (
+            (self.output_sizes,) * 2
+            if isinstance(self.output_sizes, int)
+            else self.output_sizes
+        )
+        return all(
+            bool((xs[:, dim] == x.size(dim + 2)).all())
+            for dim in (0, 1)
+            if output_sizes[dim] is not None
+        )
+
     def forward(self, x):
         x, xs = (x.data, x.sizes) if isinstance(x, PaddedTensor) else (x, None)
-        y = self._func(batch_input=x, output_sizes=self.output_sizes, batch_sizes=xs)
+        if xs is None or self.is_unpadded(x, xs):
+            # The padding does not affect the result (except at the padded
+            # positions of a non-pooled dimension), so use PyTorch's faster
+            # implementation, which also supports half precision
+            y = self._torch_func(x, output_size=self.output_sizes)
+        elif x.dtype == torch.half:
+            # nnutils does not support half precision (e.g. with AMP)
+            y = self._func(
+                batch_input=x.float().contiguous(),
+                output_sizes=self.output_sizes,
+                batch_sizes=xs,
+            ).half()
+        else:
+            # nnutils requires the default (N x C x H x W) memory format
+            y = self._func(
+                batch_input=x.contiguous(),
+                output_sizes=self.output_sizes,
+                batch_sizes=xs,
+            )
         if xs is None or self._fixed_size:
             return y
         ys = xs.clone()
@@ -30,9 +63,17 @@ class AdaptivePool2d(torch.nn.Module):
 
 class AdaptiveAvgPool2d(AdaptivePool2d):
     def __init__(self, output_size):
-        super().__init__(output_sizes=output_size, func=adaptive_avgpool_2d)
+        super().__init__(
+            output_sizes=output_size,
+            func=adaptive_avgpool_2d,
+            torch_func=F.adaptive_avg_pool2d,
+        )
 
 
 class AdaptiveMaxPool2d(AdaptivePool2d):
     def __init__(self, output_size):
-        super().__init__(output_sizes=output_size, func=adaptive_maxpool_2d)
+        super().__init__(
+            output_sizes=output_size,
+            func=adaptive_maxpool_2d,
+            torch_func=F.adaptive_max_pool2d,
+        )
@@ -22,7 +22,16 @@ def image_to_sequence(x, columnwise=True, return_packed=False):
     if xs is None:
         return x
     xs = xs[:, 1 if columnwise else 0]
-    return pack_padded_sequence(x, xs.tolist()) if return_packed else (x, xs.tolist())
+    if not return_packed:
+        return x, xs.tolist()
+    # pack_padded_sequence needs the lengths on the CPU, so copy them
+    # once instead of going through a Python list
+    xs = xs.cpu()
+    if bool((xs == x.size(0)).all()):
+        # Nothing is padded, so a plain tensor is equivalent to the packed
+        # sequence and lets the RNN use its faster padded code path
+        return x
+    return pack_padded_sequence(x, xs)
 
 
 class ImageToSequence(torch.nn.Module):
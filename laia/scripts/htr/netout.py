@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 
 import jsonargparse
 import pytorch_lightning as pl
+from jsonargparse.typing import NonNegativeInt
 
 import laia.common.logging as log
 from laia.callbacks import Netout, ProgressBar
@@ -49,6 +50,8 @@ def run(
         color_mode=data.color_mode,
         stage="test",
         num_workers=num_workers,
+        pad_width_multiple=data.pad_width_multiple,
+        sharing_strategy=data.sharing_strategy,
     )
 
     # prepare the kaldi writers
@@ -111,6 +114,15 @@ def get_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
             "Optional if `img_list` contains filepaths"
         ),
     )
+    parser.add_argument(
+        "--num_workers",
+        type=Optional[NonNegativeInt],
+        default=None,
+        help=(
+            "Number of subprocesses used to load the data. "
+            "If not set, one per CPU will be used, up to 8"
+        ),
+    )
     parser.add_class_arguments(CommonArgs, "common")
     parser.add_class_arguments(DataArgs, "data")
     parser.add_function_arguments(log.config, "logging")
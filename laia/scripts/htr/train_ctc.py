@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 import jsonargparse
 import pytorch_lightning as pl
 import torch
+from jsonargparse.typing import NonNegativeInt
 
 import laia.common.logging as log
 from laia.callbacks import LearningRate, ProgressBar, ProgressBarGPUStats
@@ -18,6 +19,8 @@ from laia.common.arguments import (
 from laia.common.loader import ModelLoader
 from laia.engine import Compose, DataModule, HTREngineModule, ImageFeeder, ItemFeeder
 from laia.loggers import EpochCSVLogger
+from laia.losses import CTCLoss
+from laia.models.htr import ConvBlock
 from laia.scripts.htr import common_main
 from laia.utils import ImageStats, SymbolsTable
 
@@ -37,6 +40,10 @@ def run(
 ):
     pl.seed_everything(common.seed)
 
+    if train.allow_tf32:
+        # cuDNN (convolutions and RNNs) already allows TF32 by default
+        torch.backends.cuda.matmul.allow_tf32 = True
+
     loader = ModelLoader(
         common.train_path, filename=common.model_filename, device="cpu"
     )
@@ -55,6 +62,14 @@ def run(
     assert (
         model is not None
     ), "Could not find the model. Have you run pylaia-htr-create-model?"
+    if train.channels_last:
+        model = model.to(memory_format=torch.channels_last)
+        if any(isinstance(m, ConvBlock) and m.use_masks for m in model.modules()):
+            log.warning(
+                "The model uses masks, which convert the convolution outputs back "
+                "to the channels first memory format. channels_last will have "
+                "little effect"
+            )
 
     # prepare the symbols
     syms = SymbolsTable(syms)
@@ -65,9 +80,12 @@ def run(
     engine_module = HTREngineModule(
         model,
         [syms[d] for d in train.delimiters],
+        criterion=CTCLoss(use_cudnn=train.cudnn_ctc_loss),
         optimizer=optimizer,
         scheduler=scheduler,
-        batch_input_fn=Compose([ItemFeeder("img"), ImageFeeder()]),
+        batch_input_fn=Compose(
+            [ItemFeeder("img"), ImageFeeder(channels_last=train.channels_last)]
+        ),
         batch_target_fn=ItemFeeder("txt"),
         batch_id_fn=ItemFeeder("id"),  # Used to print image ids on exception
     )
@@ -91,8 +109,13 @@ def run(
         color_mode=data.color_mode,
         shuffle_tr=not bool(trainer.limit_train_batches),
         augment_tr=train.augment_training,
+        bucket_tr=train.bucket_by_width,
+        img_cache_size=train.img_cache_size * 2**20,
+        preload_va=train.preload_validation,
         stage="fit",
         num_workers=num_workers,
+        pad_width_multiple=data.pad_width_multiple,
+        sharing_strategy=data.sharing_strategy,
     )
 
     # prepare the training callbacks
@@ -185,6 +208,15 @@ def get_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
         type=str,
         help="Character transcription of each validation image",
     )
+    parser.add_argument(
+        "--num_workers",
+        type=Optional[NonNegativeInt],
+        default=None,
+        help=(
+            "Number of subprocesses used to load the data. "
+            "If not set, one per CPU will be used, up to 8"
+        ),
+    )
     parser.add_class_arguments(CommonArgs, "common")
     parser.add_class_arguments(DataArgs, "data")
     parser.add_class_arguments(TrainArgs, "train")
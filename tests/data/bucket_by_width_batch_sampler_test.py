@@ -0,0 +1,32 @@
+import pytest
+
+from laia.data.bucket_by_width_batch_sampler import BucketByWidthBatchSampler
+
+
+def test_bucket_by_width_batch_sampler():
+    widths = [10, 100, 11, 101, 12, 102, 13]
+    sampler = BucketByWidthBatchSampler(widths, batch_size=2, shuffle=False)
+    assert list(sampler) == [[0, 2], [4, 6], [1, 3], [5]]
+    assert len(sampler) == 4
+
+
+def test_bucket_by_width_batch_sampler_drop_last():
+    widths = [10, 100, 11, 101, 12, 102, 13]
+    sampler = BucketByWidthBatchSampler(
+        widths, batch_size=2, shuffle=False, drop_last=True
+    )
+    assert list(sampler) == [[0, 2], [4, 6], [1, 3]]
+    assert len(sampler) == 3
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_bucket_by_width_batch_sampler_covers_dataset(shuffle):
+    widths = list(range(1, 200, 3))
+    sampler = BucketByWidthBatchSampler(widths, batch_size=4, shuffle=shuffle)
+    batches = list(sampler)
+    assert len(batches) == len(sampler)
+    assert all(len(b) <= 4 for b in batches)
+    assert sorted(i for b in batches for i in b) == list(range(len(widths)))
+    for b in batches:
+        ws = [widths[i] for i in b]
+        assert max(ws) / min(ws) < 1.25**2
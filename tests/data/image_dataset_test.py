@@ -21,3 +21,19 @@ def test_image_dataset(monkeypatch, transform):
         np.testing.assert_allclose(expected_image, dataset[0]["img"])
     else:
         assert dataset[0]["img"] == 1
+
+
+def test_image_dataset_cache(monkeypatch):
+    opened = []
+
+    def open_image(filepath):
+        opened.append(filepath)
+        return PIL.Image.new("L", (10, 10))
+
+    monkeypatch.setattr(PIL.Image, "open", open_image)
+    # room for 2 images of 10x10 pixels
+    dataset = ImageDataset(["a.jpg", "b.jpg", "c.jpg"], cache_size=250)
+    assert opened == ["a.jpg", "b.jpg", "c.jpg"]
+    for i in [0, 1, 0, 1, 2, 0, 2]:
+        assert dataset[i]["img"].size == (10, 10)
+    assert opened == ["a.jpg", "b.jpg", "c.jpg", "c.jpg", "c.jpg"]
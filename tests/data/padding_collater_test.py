@@ -74,6 +74,16 @@ class TestPaddingCollater(unittest.TestCase):
         expected = (len(batch), 5, 25, 40)
         self.assertEqual(expected, max_sizes)
 
+    def test_max_sizes_with_size_multiples(self):
+        C = 1
+        batch = [torch.rand(C, 20, 40), torch.rand(C, 25, 30), torch.rand(C, 15, 35)]
+        sizes = (C, None, None)
+        max_sizes = PaddingCollater.get_max_sizes(
+            batch, sizes=sizes, size_multiples=(8, None, 32)
+        )
+        expected = (len(batch), C, 25, 64)
+        self.assertEqual(expected, max_sizes)
+
     def check_collated(self, batch, max_sizes, collated):
         self.assertEqual(collated.size(), max_sizes)
         for i, x in enumerate(batch):
@@ -145,6 +155,19 @@ class TestPaddingCollater(unittest.TestCase):
             self.assertEqual(list(b["img"].size()), xs[i].tolist())
         self.check_collated([b["img"] for b in batch], (3, 3, 25, 40), x)
 
+    def test_collate_with_dict_and_size_multiples(self):
+        sizes = {"img": (3, None, None)}
+        collate_fn = PaddingCollater(sizes, size_multiples={"img": (None, None, 16)})
+        batch = [
+            {"img": torch.rand(3, 20, 40)},
+            {"img": torch.rand(3, 25, 30)},
+            {"img": torch.rand(3, 15, 35)},
+        ]
+        x, xs = collate_fn(batch)["img"]
+        for i, b in enumerate(batch):
+            self.assertEqual(list(b["img"].size()), xs[i].tolist())
+        self.check_collated([b["img"] for b in batch], (3, 3, 25, 48), x)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,3 +20,19 @@ def test_image_dataset(transform, monkeypatch):
     assert len(dataset) == 1
     assert list(dataset[0].keys()) == ["img", "txt"]
     assert dataset[0]["txt"] == "bar" if transform is None else 1
+
+
+def test_image_dataset_transforms_txts_once(monkeypatch):
+    monkeypatch.setattr(ImageDataset, "__getitem__", lambda *_: {"img": None})
+    calls = []
+
+    def transform(x):
+        calls.append(x)
+        return len(x)
+
+    dataset = TextImageDataset(
+        ["a.jpg", "b.jpg"], ["bar", "ba"], txt_transform=transform
+    )
+    assert calls == ["bar", "ba"]
+    assert [dataset[i]["txt"] for i in (0, 1, 0)] == [3, 2, 3]
+    assert calls == ["bar", "ba"]
@@ -5,7 +5,7 @@ import pytest
 import torch
 from PIL import Image
 
-from laia.data.transforms.vision import Convert, Invert, ToImageTensor
+from laia.data.transforms.vision import Convert, Invert, RandomBetaAffine, ToImageTensor
 
 
 def test_invert():
@@ -137,3 +137,12 @@ def test_to_image_tensor():
         "  ToTensor()\n"
         ")"
     )
+
+
+def test_random_beta_affine_get_affine_transform():
+    src = np.asarray([(0, 0), (0, 30), (100, 0)], dtype=np.float32)
+    dst = src + np.asarray([(1, 2), (-3, 1), (2, -2)], dtype=np.float32)
+    a, b, c, d, e, f = RandomBetaAffine.get_affine_transform(src, dst)
+    for (x, y), (u, v) in zip(src, dst):
+        assert math.isclose(a * x + b * y + c, u, abs_tol=1e-3)
+        assert math.isclose(d * x + e * y + f, v, abs_tol=1e-3)
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+import laia.engine.data_module
+from laia.data.bucket_by_width_batch_sampler import BucketByWidthBatchSampler
+from laia.data.unpadded_distributed_sampler import UnpaddedDistributedSampler
+from laia.engine import DataModule
+
+
+def get_trainer(**kwargs):
+    flags = {"use_ddp", "use_ddp2", "use_horovod", "use_tpu", "on_gpu"}
+    return SimpleNamespace(**{**{k: False for k in flags}, **kwargs})
+
+
+class Dataset:
+    instances = []
+    imgs = ["10.jpg", "100.jpg", "10.jpg", "100.jpg", "11.jpg"]
+
+    def __init__(self, *_, **__):
+        self.loaded = []
+        Dataset.instances.append(self)
+
+    def __len__(self):
+        return 5
+
+    def __getitem__(self, index):
+        self.loaded.append(index)
+        return {"id": index}
+
+
+def test_preload_samples():
+    ds = Dataset()
+    samples = DataModule.preload_samples(ds, [1, 3])
+    assert samples == [None, {"id": 1}, None, {"id": 3}, None]
+    assert ds.loaded == [1, 3]
+
+
+def test_preload_validation_ddp(monkeypatch):
+    monkeypatch.setattr(
+        laia.engine.data_module, "TextImageFromTextTableDataset", Dataset
+    )
+    data_module = DataModule(syms={}, preload_va=True, num_workers=4)
+    data_module.trainer = get_trainer(
+        use_ddp=True, num_nodes=1, num_processes=2, global_rank=1
+    )
+    Dataset.instances.clear()
+    data_module.setup("fit")
+    _, va_ds = Dataset.instances
+    # only the samples of this process are loaded
+    assert va_ds.loaded == [1, 3]
+    assert data_module.va_ds == [None, {"id": 1}, None, {"id": 3}, None]
+    loaders = [data_module.val_dataloader() for _ in range(2)]
+    for loader in loaders:
+        assert loader.dataset is data_module.va_ds
+        assert loader.num_workers == 0
+        assert isinstance(loader.sampler, UnpaddedDistributedSampler)
+        assert list(loader.sampler) == [1, 3]
+    # the samples are not loaded again
+    assert va_ds.loaded == [1, 3]
+
+
+@pytest.mark.parametrize(
+    "distributed", [None, "use_ddp", "use_ddp2", "use_horovod", "use_tpu"]
+)
+def test_bucket_by_width(monkeypatch, distributed):
+    monkeypatch.setattr(
+        laia.engine.data_module, "TextImageFromTextTableDataset", Dataset
+    )
+    monkeypatch.setattr(
+        laia.engine.data_module.imagesize,
+        "get",
+        lambda filepath: (int(filepath.split(".")[0]), 1),
+    )
+    data_module = DataModule(
+        syms={}, batch_size=2, shuffle_tr=False, bucket_tr=True, num_workers=0
+    )
+    data_module.trainer = get_trainer(**({distributed: True} if distributed else {}))
+    data_module.setup("fit")
+    loader = data_module.train_dataloader()
+    if distributed is None:
+        assert isinstance(loader.batch_sampler, BucketByWidthBatchSampler)
+        assert list(loader.batch_sampler) == [[0, 2], [4], [1, 3]]
+    else:
+        # falls back to random batches
+        assert not isinstance(loader.batch_sampler, BucketByWidthBatchSampler)
+        assert loader.batch_size == 2
@@ -24,6 +24,17 @@ def test_configure_optimizers(name, expected):
         model, lambda x: x, optimizer=OptimizerArgs(name=name)
     ).configure_optimizers()
     assert isinstance(optimizer, expected)
+    assert optimizer.defaults["foreach"]
+
+
+def test_optimizer_zero_grad():
+    model = DummyModel((3, 3), 10)
+    module = EngineModule(model, lambda x: x)
+    optimizer = module.configure_optimizers()
+    for p in module.parameters():
+        p.grad = torch.ones_like(p)
+    module.optimizer_zero_grad(0, 0, optimizer, 0)
+    assert all(p.grad is None for p in module.parameters())
 
 
 def test_configure_optimizers_scheduler():
@@ -29,6 +29,13 @@ def test_image_feeder(x, expected):
     assert feeder(x).data.size() == expected
 
 
+def test_image_feeder_channels_last():
+    feeder = ImageFeeder(channels_last=True)
+    x = feeder(torch.empty(2, 3, 10, 20))
+    assert x.size() == (2, 3, 10, 20)
+    assert x.is_contiguous(memory_format=torch.channels_last)
+
+
 def test_view_as_4d_raises():
     with pytest.raises(ValueError, match="Tensor with 5 dimensions"):
         ImageFeeder.view_as_4d(torch.empty(1, 1, 1, 1, 1))
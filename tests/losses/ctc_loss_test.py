@@ -119,6 +119,30 @@ def test_forward(caplog, dtype, device, average_frames, reduction):
     )
 
 
+def test_forward_half():
+    # Size: T=4 x B=2 x C=3
+    x = torch.randn(4, 2, 3).half()
+    y = [[1, 2], [2]]
+    ctc = CTCLoss(reduction="none")
+    loss = ctc(x, y)
+    assert loss.dtype == torch.float
+    torch.testing.assert_allclose(loss, ctc(x.float(), y))
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="cuDNN needs CUDA")
+def test_use_cudnn():
+    # Size: T=4 x B=2 x C=3. All the input lengths are equal to T,
+    # so the cuDNN implementation can be used
+    x = torch.randn(4, 2, 3, device="cuda", requires_grad=True)
+    y = [[1, 2], [2]]
+    expected = CTCLoss(reduction="none")(x, y)
+    (expected_dx,) = torch.autograd.grad(expected.sum(), inputs=x)
+    loss = CTCLoss(reduction="none", use_cudnn=True)(x, y)
+    (dx,) = torch.autograd.grad(loss.sum(), inputs=x)
+    torch.testing.assert_allclose(loss, expected)
+    torch.testing.assert_allclose(dx, expected_dx)
+
+
 @pytest.mark.parametrize(
     "device", ["cpu", "cuda"] if torch.cuda.is_available() else ["cpu"]
 )
@@ -74,6 +74,13 @@ class ConvBlockTest(unittest.TestCase):
         torch.testing.assert_allclose(torch.zeros(1, 8, 13), y[2, :, 3:, :])
         torch.testing.assert_allclose(torch.zeros(1, 11, 11), y[2, :, :, 2:])
 
+    def test_mask_half(self):
+        x = torch.randn(3, 1, 11, 13).half()
+        xs = torch.tensor([[11, 13], [10, 12], [3, 2]])
+        y = ConvBlock.mask(x, xs)
+        self.assertEqual(y.dtype, torch.half)
+        torch.testing.assert_allclose(y, ConvBlock.mask(x.float(), xs).half())
+
 
 def padded_cost_function(padded_y):
     y, ys = padded_y.data, padded_y.sizes
@@ -63,6 +63,28 @@ class LaiaCRNNTest(unittest.TestCase):
         ):
             m.get_min_valid_image_size(128)
 
+    def test_rnn_dropout(self):
+        for rnn_layers, expected in (1, 0.0), (3, 0.5):
+            m = LaiaCRNN(
+                1,
+                30,
+                cnn_num_features=[16],
+                cnn_kernel_size=[3],
+                cnn_stride=[1],
+                cnn_dilation=[1],
+                cnn_activation=[torch.nn.ReLU],
+                cnn_poolsize=[2],
+                cnn_dropout=[0],
+                cnn_batchnorm=[False],
+                image_sequencer="avgpool-16",
+                rnn_units=128,
+                rnn_layers=rnn_layers,
+                rnn_dropout=0.5,
+                lin_dropout=0.5,
+            )
+            # the dropout between rnn layers is only used with multiple layers
+            self.assertEqual(m.rnn.dropout, expected)
+
     def test_exception_on_small_inputs(self):
         m = LaiaCRNN(
             1,
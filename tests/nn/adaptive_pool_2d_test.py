@@ -1,5 +1,6 @@
 import unittest
 
+import nnutils_pytorch
 import torch
 
 from laia.data import PaddedTensor
@@ -120,6 +121,26 @@ class AdaptiveAvgPool2dTest(unittest.TestCase):
         )
         torch.testing.assert_allclose(y, expected_y)
 
+    def test_forward_padded_tensor_unpadded_height(self):
+        m = AdaptiveAvgPool2d(output_size=(2, None))
+        xs = torch.tensor([[3, 4], [3, 2]])
+        y, ys = m(PaddedTensor(self.x, xs))
+        self.assertEqual(ys.tolist(), [[2, 4], [2, 2]])
+        expected_y = nnutils_pytorch.adaptive_avgpool_2d(
+            batch_input=self.x, output_sizes=(2, None), batch_sizes=xs
+        )
+        torch.testing.assert_allclose(y[0], expected_y[0])
+        torch.testing.assert_allclose(y[1, :, :, :2], expected_y[1, :, :, :2])
+
+    def test_forward_padded_tensor_half(self):
+        m = AdaptiveAvgPool2d(output_size=(1, 2))
+        xs = torch.tensor([[2, 2], [1, 3]])
+        x = self.x.detach().half()
+        y = m(PaddedTensor(x, xs))
+        self.assertEqual(y.dtype, torch.half)
+        expected_y = m(PaddedTensor(x.float(), xs))
+        torch.testing.assert_allclose(y, expected_y.half())
+
     def test_backward_tensor(self):
         m = AdaptiveAvgPool2d(output_size=(1, 2))
         torch.autograd.gradcheck(lambda x: m(x).sum(), self.x)
@@ -243,6 +264,15 @@ class AdaptiveMaxPool2dTest(unittest.TestCase):
         )
         torch.testing.assert_allclose(y, expected_y)
 
+    def test_forward_padded_tensor_half(self):
+        m = AdaptiveMaxPool2d(output_size=(1, 2))
+        xs = torch.tensor([[2, 2], [1, 3]])
+        x = self.x.detach().half()
+        y = m(PaddedTensor(x, xs))
+        self.assertEqual(y.dtype, torch.half)
+        expected_y = m(PaddedTensor(x.float(), xs))
+        torch.testing.assert_allclose(y, expected_y.half())
+
     def test_backward_tensor(self):
         m = AdaptiveMaxPool2d(output_size=(1, 2))
         torch.autograd.gradcheck(lambda x: m(x).sum(), self.x)
@@ -81,6 +81,20 @@ class ImageToSequenceTest(unittest.TestCase):
         )
         torch.testing.assert_allclose(dx, expected_dx)
 
+    def test_forward_packed_without_padding(self):
+        x = torch.tensor(
+            [[[[1, 2, 3], [4, 5, 6]]], [[[7, 8, 9], [10, 11, 12]]]], dtype=torch.float
+        )
+        xs = torch.tensor([[2, 3], [2, 3]])
+        m = ImageToSequence(columnwise=True, return_packed=True)
+        y = m(PaddedTensor(x, xs))
+        self.assertIsInstance(y, torch.Tensor)
+        expected_y = torch.tensor(
+            [[[1, 4], [7, 10]], [[2, 5], [8, 11]], [[3, 6], [9, 12]]],
+            dtype=torch.float,
+        )
+        torch.testing.assert_allclose(y, expected_y)
+
 
 if __name__ == "__main__":
     unittest.main()
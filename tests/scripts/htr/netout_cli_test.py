@@ -45,6 +45,7 @@ def test_entry_point():
 
 expected_config = """img_list: null
 img_dirs: null
+num_workers: null
 common:
   seed: 74565
   train_path: ''
@@ -55,6 +56,8 @@ common:
 data:
   batch_size: 8
   color_mode: L
+  pad_width_multiple: null
+  sharing_strategy: null
 logging:
   fmt: '[%(asctime)s %(levelname)s %(name)s] %(message)s'
   level: INFO
@@ -79,6 +79,7 @@ expected_config = """syms: null
 img_dirs: []
 tr_txt_table: null
 va_txt_table: null
+num_workers: null
 common:
   seed: 74565
   train_path: ''
@@ -89,6 +90,8 @@ common:
 data:
   batch_size: 8
   color_mode: L
+  pad_width_multiple: null
+  sharing_strategy: null
 train:
   delimiters:
   - <space>
@@ -97,6 +100,12 @@ train:
   early_stopping_patience: 20
   gpu_stats: false
   augment_training: false
+  bucket_by_width: false
+  img_cache_size: 0
+  preload_validation: false
+  cudnn_ctc_loss: false
+  channels_last: false
+  allow_tf32: false
 logging:
   fmt: '[%(asctime)s %(levelname)s %(name)s] %(message)s'
   level: INFO
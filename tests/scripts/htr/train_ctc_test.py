@@ -90,6 +90,33 @@ def test_train_1_epoch(tmpdir, accelerator):
     }
 
 
+@pytest.mark.parametrize(
+    "train_args",
+    [
+        ["--train.preload_validation=true"],
+        ["--train.bucket_by_width=true"],
+        ["--train.channels_last=true"],
+    ],
+)
+def test_train_1_epoch_with_train_args(tmpdir, train_args):
+    syms, img_dirs, data_module = prepare_data(tmpdir)
+    args = [
+        syms,
+        img_dirs,
+        data_module.root / "tr.gt",
+        data_module.root / "va.gt",
+        f"--common.train_path={tmpdir}",
+        "--data.batch_size=3",
+        "--train.checkpoint_k=1",
+        "--trainer.max_epochs=1",
+        *train_args,
+    ]
+    stdout, stderr = call_script(script.__file__, args)
+    assert not stdout
+    assert "Best va_cer=0." in stderr
+    assert "Model has been trained for 1 epochs" in stderr
+
+
 # TODO: fix issue with half precision
 @pytest.mark.skip(reason="Issue with half_precision")
 @pytest.mark.skipif(
@@ -98,7 +125,6 @@ def test_train_1_epoch(tmpdir, accelerator):
 )
 @pytest.mark.skipif(not torch.cuda.is_available(), reason="AMP needs CUDA")
 def test_train_half_precision(tmpdir):
-    # TODO: add test using nnutils: https://github.com/jpuigcerver/nnutils/issues/4
     syms, img_dirs, data_module = prepare_data(tmpdir, image_sequencer="none-14")
     args = [
         syms,
@@ -117,6 +143,27 @@ def test_train_half_precision(tmpdir):
     assert "Model has been trained for" in stderr
 
 
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="AMP needs CUDA")
+def test_train_half_precision_nnutils(tmpdir):
+    # the nnutils ops run in single precision
+    syms, img_dirs, data_module = prepare_data(tmpdir, image_sequencer="avgpool-8")
+    args = [
+        syms,
+        img_dirs,
+        data_module.root / "tr.gt",
+        data_module.root / "va.gt",
+        f"--common.train_path={tmpdir}",
+        "--data.batch_size=3",
+        "--trainer.fast_dev_run=true",
+        "--trainer.precision=16",
+        "--trainer.gpus=1",
+    ]
+    stdout, stderr = call_script(script.__file__, args)
+    assert "Running in fast_dev_run" in stderr
+    assert "Using native 16bit precision" in stderr
+    assert "Model has been trained for" in stderr
+
+
 def test_train_can_resume_training(tmpdir, caplog):
     syms, img_dirs, data_module = prepare_data(tmpdir)
     caplog.set_level("INFO")